@@ -14,20 +14,48 @@ This engine provides:
 - Configuration management and plugin architecture
 """
 
-__version__ = "1.0.0"
+# Version information
+VERSION_INFO = {
+    "major": 1,
+    "minor": 0,
+    "patch": 0,
+    "pre_release": None
+}
+
+__version_str__ = (
+    f"{VERSION_INFO['major']}.{VERSION_INFO['minor']}.{VERSION_INFO['patch']}"
+    + (f"-{VERSION_INFO['pre_release']}" if VERSION_INFO['pre_release'] else "")
+)
+__version__ = __version_str__
 __author__ = "Swarm Learning Team"
 __license__ = "MIT"
 
-from .core.agent import BaseAgent, LearningAgent
-from .core.engine import LearningEngine
-from .core.memory import MemoryManager, KnowledgeBase
-from .core.communication import AgentCommunicator, CoordinationProtocol
-from .core.neural import NeuralFramework, ModelManager
-from .rl.algorithms import RLAlgorithm, PPOAlgorithm, DQNAlgorithm
-from .rl.environment import AgentEnvironment, SwarmEnvironment
-from .monitoring.metrics import MetricsCollector, PerformanceMonitor
-from .config.manager import ConfigManager
-from .plugins.base import PluginManager
+import importlib
+from dataclasses import asdict, dataclass
+from typing import Optional, Tuple
+
+# Public names are resolved lazily (PEP 562) so that importing the package does
+# not pull in torch, tensorflow, zmq, redis or prometheus until they are used.
+_LAZY_IMPORTS = {
+    "BaseAgent": ".core.agent",
+    "LearningAgent": ".core.agent",
+    "LearningEngine": ".core.engine",
+    "MemoryManager": ".core.memory",
+    "KnowledgeBase": ".core.memory",
+    "AgentCommunicator": ".core.communication",
+    "CoordinationProtocol": ".core.communication",
+    "NeuralFramework": ".core.neural",
+    "ModelManager": ".core.neural",
+    "RLAlgorithm": ".rl.algorithms",
+    "PPOAlgorithm": ".rl.algorithms",
+    "DQNAlgorithm": ".rl.algorithms",
+    "AgentEnvironment": ".rl.environment",
+    "SwarmEnvironment": ".rl.environment",
+    "MetricsCollector": ".monitoring.metrics",
+    "PerformanceMonitor": ".monitoring.metrics",
+    "ConfigManager": ".config.manager",
+    "PluginManager": ".plugins.base",
+}
 
 __all__ = [
     # Core Components
@@ -55,47 +83,123 @@ __all__ = [
     "PluginManager",
 ]
 
-# Version information
-VERSION_INFO = {
-    "major": 1,
-    "minor": 0,
-    "patch": 0,
-    "pre_release": None
-}
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 def get_version():
     """Get the current version string."""
-    version = f"{VERSION_INFO['major']}.{VERSION_INFO['minor']}.{VERSION_INFO['patch']}"
-    if VERSION_INFO['pre_release']:
-        version += f"-{VERSION_INFO['pre_release']}"
-    return version
+    return __version_str__
+
+
+def install_event_loop_policy():
+    """Use uvloop for the agent runtime when it is installed.
+    
+    Call before starting the event loop (e.g. before ``asyncio.run``).
+    Returns True if uvloop was installed; otherwise the stdlib default
+    policy is left in place (Windows, free-threaded builds).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    import asyncio
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 # Engine configuration
-DEFAULT_CONFIG = {
-    "engine": {
-        "max_agents": 100,
-        "coordination_protocol": "hierarchical",
-        "memory_backend": "redis",
-        "neural_framework": "pytorch",
-        "logging_level": "INFO"
-    },
-    "learning": {
-        "algorithm": "ppo",
-        "learning_rate": 0.001,
-        "batch_size": 32,
-        "memory_size": 10000,
-        "exploration_rate": 0.1
-    },
-    "communication": {
-        "protocol": "zmq",
-        "port_range": [8000, 9000],
-        "timeout": 30,
-        "retry_attempts": 3
-    },
-    "monitoring": {
-        "enable_metrics": True,
-        "metrics_backend": "prometheus",
-        "performance_tracking": True,
-        "log_level": "INFO"
-    }
-}
\ No newline at end of file
+@dataclass(frozen=True, slots=True)
+class EngineCfg:
+    max_agents: int = 100
+    coordination_protocol: str = "hierarchical"
+    memory_backend: str = "redis"
+    neural_framework: str = "pytorch"
+    logging_level: str = "INFO"
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryCfg:
+    # Pipelining, TTLs and hash packing are off until the memory manager reads them
+    pool_size: int = 64
+    pipeline: bool = False
+    default_ttl_s: Optional[int] = None  # None: keys never expire
+    key_prefix: str = "swarm:"
+    use_hash_for_small_objects: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class LearningCfg:
+    algorithm: str = "ppo"
+    learning_rate: float = 0.001
+    batch_size: int = 32
+    memory_size: int = 10000
+    exploration_rate: float = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class InferenceCacheCfg:
+    enabled: bool = False  # nothing in the engine reads the cache yet
+    backend: str = "sqlite"
+    path: str = ".swarm_infer_cache.sqlite"
+    max_mb: int = 512
+
+
+@dataclass(frozen=True, slots=True)
+class NeuralCfg:
+    inference_cache: InferenceCacheCfg = InferenceCacheCfg()
+
+
+@dataclass(frozen=True, slots=True)
+class CommCfg:
+    protocol: str = "zmq"
+    port_range: Tuple[int, int] = (8000, 9000)
+    timeout: int = 30
+    retry_attempts: int = 3
+    # Socket pattern and send batching are off until the communicator reads them
+    pattern: Optional[str] = None  # None: keep the communicator's current pattern
+    batch_window_ms: int = 0  # 0: send each message immediately
+    batch_max_msgs: int = 64
+    serializer: str = "msgpack"  # msgpack | cloudpickle | json
+
+
+@dataclass(frozen=True, slots=True)
+class MonitoringCfg:
+    enable_metrics: bool = True
+    metrics_backend: str = "prometheus"
+    performance_tracking: bool = True
+    log_level: str = "INFO"
+    # Sampling and counter overrides are off until the metrics collector reads them
+    sample_rate: float = 1.0
+    counter_backend: Optional[str] = None  # None: use metrics_backend
+    flush_interval_s: float = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class SwarmCfg:
+    """Immutable configuration tree; read as ``cfg.engine.max_agents``."""
+    engine: EngineCfg = EngineCfg()
+    memory: MemoryCfg = MemoryCfg()
+    learning: LearningCfg = LearningCfg()
+    neural: NeuralCfg = NeuralCfg()
+    communication: CommCfg = CommCfg()
+    monitoring: MonitoringCfg = MonitoringCfg()
+
+
+DEFAULTS = SwarmCfg()
+
+# Plain dict copy of DEFAULTS for callers using string keys (copyable and
+# JSON-serializable); port_range keeps its historical list form
+DEFAULT_CONFIG = asdict(DEFAULTS)
+DEFAULT_CONFIG["communication"]["port_range"] = list(DEFAULTS.communication.port_range)
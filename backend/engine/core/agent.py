@@ -10,17 +10,23 @@ This module provides the foundational agent classes that support:
 """
 
 import asyncio
+import functools
+import hashlib
+import math
+import random
 import uuid
 import time
 import logging
+import zlib
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Callable, Union
-from dataclasses import dataclass, field
+from collections import Counter, deque
+from itertools import chain, islice
+from typing import AsyncIterator, Awaitable, Deque, Dict, Iterable, List, Any, Optional, Callable, Set, Tuple, Union
+from dataclasses import asdict, dataclass, field, fields
 from enum import Enum
 import numpy as np
 import torch
 import torch.nn as nn
-from pydantic import BaseModel, Field
 
 from .memory import MemoryManager, KnowledgeBase
 from .communication import AgentCommunicator
@@ -67,6 +73,7 @@ class AgentConfig:
     discount_factor: float = 0.99
     batch_size: int = 32
     update_frequency: int = 100
+    torch_compile: bool = False
     
     # Memory parameters
     memory_backend: str = "redis"
@@ -76,37 +83,231 @@ class AgentConfig:
     # Communication parameters
     message_queue_size: int = 1000
     heartbeat_interval: int = 30
+    max_inflight_heartbeats: int = 4
     timeout_duration: int = 60
+    metrics_interval: int = 60
+    # None: reuse _metrics_loop's snapshot for one full collection period
+    metrics_cache_ttl: Optional[float] = None
 
 
-class AgentAction(BaseModel):
+# Width of the feature vector produced by LearningAgent._observation_to_tensor
+OBSERVATION_FEATURE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=1024)
+def _observation_type_feature(observation_type: str) -> float:
+    """Map an observation type to a feature in [0, 1).
+    
+    Uses CRC32 rather than hash(), which is salted per process
+    (PYTHONHASHSEED) and would give each agent a different encoding.
+    """
+    return (zlib.crc32(observation_type.encode()) & 0x3FF) / 1024.0
+
+
+def _encode_observation_features(
+    out: np.ndarray,
+    confidence: float,
+    data_length: int,
+    type_feature: float,
+    time_of_day: float
+) -> np.ndarray:
+    """Write observation features into ``out`` (primitive arguments only)."""
+    out[0] = confidence
+    out[1] = data_length
+    out[2] = type_feature
+    out[3] = time_of_day
+    return out
+
+
+def _q_learning_loss(
+    model: nn.Module,
+    state_tensor: torch.Tensor,
+    action_tensor: torch.Tensor,
+    reward_tensor: torch.Tensor,
+    next_state_tensor: torch.Tensor,
+    done_tensor: torch.Tensor,
+    discount_factor: float
+) -> torch.Tensor:
+    """Compute the Q-learning loss for a batch (tensors only, so it can be compiled)."""
+    # Targets never need gradients, so keep next-state activations out of the graph
+    with torch.no_grad():
+        next_q = model(next_state_tensor).max(dim=1).values
+        # Terminal transitions do not bootstrap from the next state
+        target = reward_tensor + discount_factor * (1.0 - done_tensor) * next_q
+    
+    # Only the Q-value of the action taken contributes to the loss
+    q_sa = model(state_tensor).gather(1, action_tensor.unsqueeze(1)).squeeze(1)
+    
+    return nn.functional.mse_loss(q_sa, target)
+
+
+def _match_fedavg_tensors(
+    named_tensors: Iterable[Tuple[str, torch.Tensor]],
+    weights: Dict[str, torch.Tensor]
+) -> Tuple[List[str], List[torch.Tensor], List[torch.Tensor]]:
+    """Pair local floating-point tensors with same-named remote ones.
+    
+    Every pair is checked before the caller blends anything in place, so a
+    single bad tensor cannot leave the model half-updated. Raises ValueError
+    if a remote tensor is not floating point or its shape differs.
+    """
+    names, local, remote = [], [], []
+    for name, tensor in named_tensors:
+        incoming = weights.get(name)
+        if incoming is None or not tensor.is_floating_point():
+            continue
+        if not incoming.is_floating_point():
+            raise ValueError(f"{name}: expected a floating-point tensor, got {incoming.dtype}")
+        if incoming.shape != tensor.shape:
+            raise ValueError(
+                f"{name}: shape {tuple(incoming.shape)} does not match {tuple(tensor.shape)}"
+            )
+        names.append(name)
+        local.append(tensor)
+        remote.append(incoming)
+    return names, local, remote
+
+
+def _encode_tensor(tensor: torch.Tensor) -> Tuple[List[int], str, bytes]:
+    """Flatten a tensor to ``(shape, dtype, raw bytes)`` for the wire."""
+    tensor = tensor.detach().cpu().contiguous()
+    # numpy has no bfloat16, so copy the bytes out through a uint8 view
+    raw = tensor.reshape(-1).view(torch.uint8).numpy().tobytes()
+    return list(tensor.shape), str(tensor.dtype).removeprefix("torch."), raw
+
+
+def _decode_tensor(shape: List[int], dtype: str, raw: bytes) -> torch.Tensor:
+    """Rebuild a tensor produced by ``_encode_tensor``."""
+    torch_dtype = getattr(torch, dtype, None)
+    if not isinstance(torch_dtype, torch.dtype):
+        raise ValueError(f"unknown tensor dtype: {dtype}")
+    if not isinstance(shape, (list, tuple)) or not all(
+        isinstance(dim, int) and dim >= 0 for dim in shape
+    ):
+        raise ValueError(f"invalid tensor shape: {shape!r}")
+    itemsize = torch.empty((), dtype=torch_dtype).element_size()
+    if math.prod(shape) * itemsize != len(raw):
+        raise ValueError(f"{len(raw)} bytes do not fill a {dtype} tensor of shape {list(shape)}")
+    if not raw:
+        return torch.empty(shape, dtype=torch_dtype)
+    return torch.frombuffer(bytearray(raw), dtype=torch_dtype).view(shape)
+
+
+def _coerce_number(value: Any, kind: type, name: str) -> Any:
+    """Coerce ``value`` to ``kind`` (int or float), raising ValueError if it does not fit."""
+    if isinstance(value, bool) or (
+        kind is int and isinstance(value, float) and not value.is_integer()
+    ):
+        raise ValueError(f"{name} must be {kind.__name__}, got {value!r}")
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be {kind.__name__}, got {value!r}") from None
+
+
+def _check_priority(priority: int) -> None:
+    if not isinstance(priority, int) or not 1 <= priority <= 10:
+        raise ValueError(f"priority must be an int between 1 and 10, got {priority!r}")
+
+
+def _blend_inplace(
+    local: List[torch.Tensor],
+    remote: List[torch.Tensor],
+    remote_share: float
+) -> None:
+    """Move each local tensor toward its remote counterpart by ``remote_share``, in place."""
+    # Matching dtypes go through one fused lerp kernel; mixed pairs (bfloat16
+    # updates into float32 weights) scale and accumulate, letting the add
+    # kernel upcast instead of materializing a float32 copy
+    lerp_local, lerp_remote, mixed_local, mixed_remote = [], [], [], []
+    can_lerp = hasattr(torch, "_foreach_lerp_")
+    for local_tensor, remote_tensor in zip(local, remote):
+        if can_lerp and local_tensor.dtype == remote_tensor.dtype:
+            lerp_local.append(local_tensor)
+            lerp_remote.append(remote_tensor)
+        else:
+            mixed_local.append(local_tensor)
+            mixed_remote.append(remote_tensor)
+    
+    with torch.no_grad():
+        if lerp_local:
+            torch._foreach_lerp_(lerp_local, lerp_remote, remote_share)
+        if mixed_local:
+            torch._foreach_mul_(mixed_local, 1.0 - remote_share)
+            torch._foreach_add_(mixed_local, mixed_remote, alpha=remote_share)
+
+
+@dataclass(slots=True, kw_only=True)
+class AgentAction:
     """Represents an action taken by an agent."""
-    action_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    action_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     action_type: str
-    parameters: Dict[str, Any] = Field(default_factory=dict)
-    timestamp: float = Field(default_factory=time.time)
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
     expected_duration: Optional[float] = None
-    priority: int = Field(default=5, ge=1, le=10)
+    priority: int = 5
+    
+    def __post_init__(self) -> None:
+        _check_priority(self.priority)
 
 
-class AgentObservation(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AgentObservation:
     """Represents an observation made by an agent."""
-    observation_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    observation_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     observation_type: str
     data: Dict[str, Any]
-    timestamp: float = Field(default_factory=time.time)
-    confidence: float = Field(default=1.0, ge=0.0, le=1.0)
+    timestamp: float = field(default_factory=time.time)
+    confidence: float = 1.0
     source: str
+    
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(f"confidence must be between 0 and 1, got {self.confidence}")
 
 
-class AgentGoal(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AgentGoal:
     """Represents a goal that an agent is working towards."""
-    goal_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    goal_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     description: str
-    target_metrics: Dict[str, float] = Field(default_factory=dict)
+    target_metrics: Dict[str, float] = field(default_factory=dict)
     deadline: Optional[float] = None
-    priority: int = Field(default=5, ge=1, le=10)
-    status: str = Field(default="active")  # active, completed, failed, paused
+    priority: int = 5
+    status: str = "active"  # active, completed, failed, paused
+    
+    def __post_init__(self) -> None:
+        _check_priority(self.priority)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentGoal":
+        """Build a goal from untrusted data (peer messages, saved state).
+        
+        Unknown keys are ignored and numeric strings are coerced, as the old
+        pydantic model did; anything else that does not fit raises ValueError.
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"goal data must be a dict, got {type(data).__name__}")
+        values = {f.name: data[f.name] for f in fields(cls) if f.name in data}
+        if "description" not in values:
+            raise ValueError("goal data is missing 'description'")
+        
+        for name in ("goal_id", "description", "status"):
+            if name in values and not isinstance(values[name], str):
+                raise ValueError(f"{name} must be a string, got {values[name]!r}")
+        if "priority" in values:
+            values["priority"] = _coerce_number(values["priority"], int, "priority")
+        if values.get("deadline") is not None:
+            values["deadline"] = _coerce_number(values["deadline"], float, "deadline")
+        if "target_metrics" in values:
+            metrics = values["target_metrics"]
+            if not isinstance(metrics, dict):
+                raise ValueError(f"target_metrics must be a dict, got {metrics!r}")
+            values["target_metrics"] = {
+                str(key): _coerce_number(value, float, f"target_metrics[{key!r}]")
+                for key, value in metrics.items()
+            }
+        return cls(**values)
 
 
 class BaseAgent(ABC):
@@ -146,9 +347,12 @@ class BaseAgent(ABC):
         # Internal state
         self.goals: List[AgentGoal] = []
         self.current_task: Optional[str] = None
-        self.action_history: List[AgentAction] = []
-        self.observation_history: List[AgentObservation] = []
+        self.action_history: Deque[AgentAction] = deque(maxlen=config.memory_size)
+        self.observation_history: Deque[AgentObservation] = deque(maxlen=config.memory_size)
+        self._goal_status_counts: Counter = Counter()
+        self._goal_dicts: Dict[str, Dict[str, Any]] = {}
         self.performance_metrics: Dict[str, float] = {}
+        self._metrics_cache: Tuple[float, Dict[str, Any]] = (float("-inf"), {})
         
         # Logging
         self.logger = logging.getLogger(f"agent.{self.agent_id}")
@@ -156,6 +360,11 @@ class BaseAgent(ABC):
         # Async components
         self._running = False
         self._tasks: List[asyncio.Task] = []
+        self._goal_event = asyncio.Event()
+        self._heartbeat_slots = asyncio.Semaphore(config.max_inflight_heartbeats)
+        self._heartbeat_sends: Set[asyncio.Task] = set()
+        self._action_queues: Dict[str, asyncio.Queue] = {}
+        self._action_slots = asyncio.Semaphore(config.max_concurrent_tasks)
         
     async def initialize(self) -> None:
         """Initialize the agent and its components."""
@@ -208,12 +417,23 @@ class BaseAgent(ABC):
         self.logger.info(f"Stopping agent {self.agent_id}")
         self._running = False
         
-        # Cancel all tasks
-        for task in self._tasks:
+        # Let already-dispatched actions finish before workers are cancelled
+        if self._action_queues:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(queue.join() for queue in self._action_queues.values())),
+                    timeout=self.config.timeout_duration
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning("Timed out waiting for queued actions; dropping the rest")
+        
+        # Cancel all tasks, including heartbeats still being sent
+        pending = [*self._tasks, *self._heartbeat_sends]
+        for task in pending:
             task.cancel()
         
         # Wait for tasks to complete
-        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*pending, return_exceptions=True)
         
         # Save state
         await self._save_state()
@@ -244,46 +464,63 @@ class BaseAgent(ABC):
     async def add_goal(self, goal: AgentGoal) -> None:
         """Add a new goal for the agent to work towards."""
         self.goals.append(goal)
+        self._goal_status_counts[goal.status] += 1
+        self._goal_event.set()
         self.logger.info(f"Added goal: {goal.description}")
         await self.memory_manager.store_experience({
             "type": "goal_added",
-            "goal": goal.dict(),
+            "goal": self._goal_dict(goal),
             "timestamp": time.time()
         })
     
     async def observe(self, observation: AgentObservation) -> None:
         """Process a new observation."""
         self.observation_history.append(observation)
-        self.logger.debug(f"Received observation: {observation.observation_type}")
+        self.logger.debug("Received observation: %s", observation.observation_type)
         
         # Store in memory
         await self.memory_manager.store_experience({
             "type": "observation",
-            "observation": observation.dict(),
+            "observation": asdict(observation),
             "timestamp": time.time()
         })
         
         # Process observation and generate actions
         actions = await self.process_observation(observation)
         
-        # Execute actions
+        # Queue actions for execution
         for action in actions:
-            await self._execute_action_async(action)
+            self._dispatch_action(action)
     
     async def communicate(self, message: Dict[str, Any], target_agent: Optional[str] = None) -> None:
         """Send a message to other agents."""
         await self.communicator.send_message(message, target_agent)
-        self.logger.debug(f"Sent message: {message.get('type', 'unknown')}")
+        self.logger.debug("Sent message: %s", message.get("type", "unknown"))
     
     async def get_metrics(self) -> Dict[str, Any]:
-        """Get current performance metrics."""
+        """Get current performance metrics, reusing the latest periodic snapshot.
+        
+        Snapshots younger than metrics_cache_ttl (by default metrics_interval,
+        so heartbeats read what _metrics_loop collected) are reused; callers
+        get a shallow copy so they cannot alter the cached one.
+        """
+        ttl = self.config.metrics_cache_ttl
+        if ttl is None:
+            ttl = self.config.metrics_interval
+        cached_at, metrics = self._metrics_cache
+        if time.monotonic() - cached_at < ttl:
+            return dict(metrics)
+        return await self._collect_metrics()
+    
+    async def _collect_metrics(self) -> Dict[str, Any]:
+        """Collect a fresh metrics snapshot and cache it."""
         base_metrics = {
             "agent_id": self.agent_id,
             "agent_type": self.agent_type.value,
             "state": self.state.value,
             "goals_count": len(self.goals),
-            "active_goals": len([g for g in self.goals if g.status == "active"]),
-            "completed_goals": len([g for g in self.goals if g.status == "completed"]),
+            "active_goals": self._goal_status_counts["active"],
+            "completed_goals": self._goal_status_counts["completed"],
             "actions_taken": len(self.action_history),
             "observations_processed": len(self.observation_history),
             "memory_utilization": await self.memory_manager.get_utilization(),
@@ -294,71 +531,132 @@ class BaseAgent(ABC):
         agent_metrics = await self._get_agent_metrics()
         base_metrics.update(agent_metrics)
         
+        self._metrics_cache = (time.monotonic(), dict(base_metrics))
         return base_metrics
     
     async def _main_loop(self) -> None:
-        """Main agent execution loop."""
+        """Main agent execution loop, woken by goal changes."""
+        error_backoff = 1.0
         while self._running:
+            # Sleep until a goal is added or changed. Goals still active after
+            # a pass are retried every second because completion is time-based;
+            # an agent with no active goals does not wake at all.
+            if self._goal_status_counts["active"]:
+                try:
+                    await asyncio.wait_for(self._goal_event.wait(), 1)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await self._goal_event.wait()
+            self._goal_event.clear()
+            
             try:
-                if self.state == AgentState.IDLE:
-                    # Check for pending goals
+                if self.state == AgentState.IDLE and self._goal_status_counts["active"]:
                     active_goals = [g for g in self.goals if g.status == "active"]
-                    if active_goals:
-                        self.state = AgentState.EXECUTING
-                        await self._work_on_goals(active_goals)
-                        self.state = AgentState.IDLE
-                
-                await asyncio.sleep(1)  # Prevent busy waiting
+                    self.state = AgentState.EXECUTING
+                    await self._work_on_goals(active_goals)
+                    self.state = AgentState.IDLE
+                error_backoff = 1.0
                 
             except Exception as e:
                 self.logger.error(f"Error in main loop: {e}")
                 self.state = AgentState.ERROR
-                await asyncio.sleep(5)  # Error backoff
+                await asyncio.sleep(error_backoff)
+                error_backoff = min(error_backoff * 2, 60.0)
+                self.state = AgentState.IDLE
     
     async def _heartbeat_loop(self) -> None:
-        """Send periodic heartbeat messages."""
+        """Send periodic heartbeat messages.
+        
+        Each heartbeat is built and sent in its own task so a slow peer or
+        metrics backend cannot delay the cadence. When max_inflight_heartbeats
+        sends are still pending, the beat is skipped rather than queued.
+        """
         while self._running:
             try:
-                heartbeat = {
-                    "type": "heartbeat",
-                    "agent_id": self.agent_id,
-                    "timestamp": time.time(),
-                    "state": self.state.value,
-                    "metrics": await self.get_metrics()
-                }
-                await self.communicate(heartbeat)
+                if self._heartbeat_slots.locked():
+                    self.logger.warning("Skipping heartbeat: previous heartbeats still in flight")
+                else:
+                    await self._heartbeat_slots.acquire()
+                    task = asyncio.create_task(self._send_heartbeat())
+                    self._heartbeat_sends.add(task)
+                    task.add_done_callback(self._heartbeat_sends.discard)
                 await asyncio.sleep(self.config.heartbeat_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in heartbeat loop: {e}")
                 await asyncio.sleep(self.config.heartbeat_interval)
     
+    async def _send_heartbeat(self) -> None:
+        """Build and send a single heartbeat, releasing its in-flight slot."""
+        try:
+            heartbeat = {
+                "type": "heartbeat",
+                "agent_id": self.agent_id,
+                "timestamp": time.time(),
+                "state": self.state.value,
+                "metrics": await self.get_metrics()
+            }
+            await self.communicate(heartbeat)
+        except Exception as e:
+            self.logger.error(f"Error sending heartbeat: {e}")
+        finally:
+            self._heartbeat_slots.release()
+    
     async def _metrics_loop(self) -> None:
         """Collect and report metrics periodically."""
         while self._running:
             try:
-                metrics = await self.get_metrics()
+                metrics = await self._collect_metrics()
                 await self.metrics_collector.record_metrics(metrics)
-                await asyncio.sleep(60)  # Collect metrics every minute
+                await asyncio.sleep(self.config.metrics_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in metrics loop: {e}")
-                await asyncio.sleep(60)
+                await asyncio.sleep(self.config.metrics_interval)
+    
+    def _dispatch_action(self, action: AgentAction) -> asyncio.Future:
+        """Queue an action on its action-type bucket.
+        
+        Each bucket has a single worker, so actions of one type run in order
+        while different types run concurrently, up to max_concurrent_tasks.
+        Returns a future that resolves once the action has run, for callers
+        that need to wait on it.
+        """
+        queue = self._action_queues.get(action.action_type)
+        if queue is None:
+            queue = self._action_queues[action.action_type] = asyncio.Queue()
+            self._tasks.append(asyncio.create_task(self._action_worker(queue)))
+        done = asyncio.get_running_loop().create_future()
+        queue.put_nowait((action, done))
+        return done
+    
+    async def _action_worker(self, queue: asyncio.Queue) -> None:
+        """Execute actions from one bucket in arrival order."""
+        while True:
+            action, done = await queue.get()
+            try:
+                async with self._action_slots:
+                    await self._execute_action_async(action)
+            finally:
+                queue.task_done()
+                if not done.done():
+                    done.set_result(None)
     
     async def _execute_action_async(self, action: AgentAction) -> None:
         """Execute an action asynchronously."""
         try:
             self.action_history.append(action)
-            self.logger.debug(f"Executing action: {action.action_type}")
+            self.logger.debug("Executing action: %s", action.action_type)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = await self.execute_action(action)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # Store experience
             experience = {
                 "type": "action_execution",
-                "action": action.dict(),
+                "action": asdict(action),
                 "result": result,
                 "execution_time": execution_time,
                 "timestamp": time.time()
@@ -404,7 +702,7 @@ class BaseAgent(ABC):
         
         if goal_action == "add":
             goal_data = message.get("goal_data")
-            goal = AgentGoal(**goal_data)
+            goal = AgentGoal.from_dict(goal_data)
             await self.add_goal(goal)
         elif goal_action == "update":
             await self._update_goal(message)
@@ -418,7 +716,10 @@ class BaseAgent(ABC):
             if state_data:
                 # Restore goals
                 if "goals" in state_data:
-                    self.goals = [AgentGoal(**goal_data) for goal_data in state_data["goals"]]
+                    self.goals = [AgentGoal.from_dict(goal_data) for goal_data in state_data["goals"]]
+                    self._goal_status_counts = Counter(goal.status for goal in self.goals)
+                    self._goal_dicts.clear()
+                    self._goal_event.set()
                 
                 # Restore performance metrics
                 if "performance_metrics" in state_data:
@@ -434,7 +735,7 @@ class BaseAgent(ABC):
             state_data = {
                 "agent_id": self.agent_id,
                 "agent_type": self.agent_type.value,
-                "goals": [goal.dict() for goal in self.goals],
+                "goals": [self._goal_dict(goal) for goal in self.goals],
                 "performance_metrics": self.performance_metrics,
                 "timestamp": time.time()
             }
@@ -491,14 +792,44 @@ class BaseAgent(ABC):
         for goal in self.goals:
             if goal.goal_id == goal_id:
                 for key, value in updates.items():
-                    if hasattr(goal, key):
+                    if key == "status":
+                        self._set_goal_status(goal, value)
+                        self._goal_event.set()
+                    elif hasattr(goal, key):
                         setattr(goal, key, value)
+                        self._goal_dicts.pop(goal.goal_id, None)
                 break
     
     async def _remove_goal(self, message: Dict[str, Any]) -> None:
         """Remove a goal."""
         goal_id = message.get("goal_id")
-        self.goals = [goal for goal in self.goals if goal.goal_id != goal_id]
+        remaining = []
+        for goal in self.goals:
+            if goal.goal_id == goal_id:
+                self._goal_status_counts[goal.status] -= 1
+                self._goal_dicts.pop(goal_id, None)
+            else:
+                remaining.append(goal)
+        self.goals = remaining
+    
+    def _set_goal_status(self, goal: AgentGoal, status: str) -> None:
+        """Change a goal's status, keeping the per-status counts in sync."""
+        self._goal_status_counts[goal.status] -= 1
+        self._goal_status_counts[status] += 1
+        goal.status = status
+        self._goal_dicts.pop(goal.goal_id, None)
+    
+    def _goal_dict(self, goal: AgentGoal) -> Dict[str, Any]:
+        """Return the serialized form of a goal, dumping it only after it changes.
+        
+        Goals must be mutated through _update_goal/_set_goal_status for the
+        cached dict to stay current. Callers get a copy (including the nested
+        target_metrics), so storing or mutating it cannot corrupt the cache.
+        """
+        goal_dict = self._goal_dicts.get(goal.goal_id)
+        if goal_dict is None:
+            goal_dict = self._goal_dicts[goal.goal_id] = asdict(goal)
+        return {**goal_dict, "target_metrics": dict(goal_dict["target_metrics"])}
 
 
 class LearningAgent(BaseAgent):
@@ -513,6 +844,11 @@ class LearningAgent(BaseAgent):
     - Performance optimization
     """
     
+    # Fields an experience needs before it can be used for training
+    _REQUIRED_EXPERIENCE_FIELDS = frozenset(("action", "state", "reward"))
+    # Goals are considered completed this long after they were added
+    _GOAL_COMPLETION_SECONDS = 60.0
+    
     def __init__(self, config: AgentConfig):
         super().__init__(config)
         
@@ -520,11 +856,45 @@ class LearningAgent(BaseAgent):
         self.neural_model: Optional[nn.Module] = None
         self.optimizer: Optional[torch.optim.Optimizer] = None
         self.learning_algorithm: Optional[str] = None
-        self.experience_buffer: List[Dict[str, Any]] = []
+        self.experience_buffer: Deque[Dict[str, Any]] = deque(maxlen=config.memory_size)
+        self._loss_fn: Callable[..., torch.Tensor] = _q_learning_loss
+        # torch.compile wrapper around neural_model; it shares the parameters,
+        # while neural_model stays the eager module for state_dict and updates
+        self._compiled_model: Optional[nn.Module] = None
+        self._model_param_count = 0
+        self._obs_features = np.zeros(OBSERVATION_FEATURE_SIZE, dtype=np.float32)
+        # Serializes model mutation (training, federated averaging) and inference
+        self._model_lock = asyncio.Lock()
+        # Side stream for federated averaging on CUDA models, plus the event the
+        # next forward/training step must wait on before touching the weights
+        self._fedavg_stream: Optional[torch.cuda.Stream] = None
+        self._fedavg_done: Optional[torch.cuda.Event] = None
+        # Reusable pinned buffers and copy stream for saving CUDA models
+        self._weight_staging: Optional[Dict[str, torch.Tensor]] = None
+        self._save_stream: Optional[torch.cuda.Stream] = None
+        # Last weight fingerprints received from each peer, keyed by agent id
+        self._peer_weight_hashes: Dict[str, Dict[str, bytes]] = {}
+        # Monotonic time at which each goal counts as completed
+        self._goal_completion_due: Dict[str, float] = {}
+        self._shared_experience_queue: asyncio.Queue = asyncio.Queue()
+        self._experience_drain_task: Optional[asyncio.Task] = None
+        
+        # Message routing tables, keyed by resource_type / knowledge_type
+        self._resource_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {
+            "computation": self._share_computation,
+            "data": self._share_data,
+        }
+        self._knowledge_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {
+            "experiences": self._ingest_experiences,
+            "model_insights": self._ingest_insights,
+        }
         
         # Learning parameters
         self.learning_rate = config.learning_rate
-        self.exploration_rate = config.exploration_rate
+        # Exploration decays in closed form from an anchor rather than on a
+        # timer; the clock starts when the agent's tasks start
+        self._explore_start_val = config.exploration_rate
+        self._explore_start_t: Optional[float] = None
         self.discount_factor = config.discount_factor
         self.batch_size = config.batch_size
         
@@ -537,6 +907,20 @@ class LearningAgent(BaseAgent):
             "exploration_rate": self.exploration_rate
         }
     
+    @property
+    def exploration_rate(self) -> float:
+        """Epsilon, decayed by 0.999 per minute since the agent started."""
+        if self._explore_start_t is None:
+            return self._explore_start_val
+        minutes = (time.monotonic() - self._explore_start_t) / 60.0
+        return max(0.01, self._explore_start_val * 0.999 ** minutes)
+    
+    @exploration_rate.setter
+    def exploration_rate(self, value: float) -> None:
+        self._explore_start_val = value
+        if self._explore_start_t is not None:
+            self._explore_start_t = time.monotonic()
+    
     async def initialize(self) -> None:
         """Initialize the learning agent."""
         await super().initialize()
@@ -549,30 +933,67 @@ class LearningAgent(BaseAgent):
         
         self.logger.info(f"Learning agent {self.agent_id} initialized with neural model")
     
+    async def add_goal(self, goal: AgentGoal) -> None:
+        """Add a goal, recording when it will count as completed."""
+        self._goal_completion_due[goal.goal_id] = time.monotonic() + self._GOAL_COMPLETION_SECONDS
+        await super().add_goal(goal)
+    
+    async def _remove_goal(self, message: Dict[str, Any]) -> None:
+        """Remove a goal, dropping its completion deadline."""
+        await super()._remove_goal(message)
+        self._goal_completion_due.pop(message.get("goal_id"), None)
+    
+    def _set_goal_status(self, goal: AgentGoal, status: str) -> None:
+        """Change a goal's status; only active goals keep a completion deadline."""
+        super()._set_goal_status(goal, status)
+        if status != "active":
+            self._goal_completion_due.pop(goal.goal_id, None)
+    
     async def learn_from_experience(self, experience: Dict[str, Any]) -> None:
         """Learn from a single experience."""
         self.experience_buffer.append(experience)
         
         # Train if we have enough experiences
         if len(self.experience_buffer) >= self.batch_size:
-            await self._train_model()
+            async with self._model_lock:
+                await self._train_model()
     
     async def share_knowledge(self, target_agent: str, knowledge_type: str) -> None:
         """Share knowledge with another agent."""
         if knowledge_type == "model_weights" and self.neural_model:
-            weights = self.neural_model.state_dict()
+            # Send floating-point weights as bfloat16 to halve the payload;
+            # receivers cast back to their own dtype when averaging. The copies
+            # are taken under the model lock so a concurrent federated update
+            # cannot be sent half-applied; encoding happens after release
+            async with self._model_lock:
+                self._wait_for_fedavg()
+                snapshot = {
+                    key: value.to(torch.bfloat16, copy=True)
+                    if value.is_floating_point() else value.clone()
+                    for key, value in self.neural_model.state_dict().items()
+                }
+            # Tensors travel as flat (shape, dtype, bytes) triples rather than pickles
+            weights = {key: _encode_tensor(value) for key, value in snapshot.items()}
+            # Per-tensor fingerprints let the receiver skip tensors it has
+            # already averaged in from this agent
+            hashes = {
+                key: hashlib.blake2b(raw, digest_size=8).digest()
+                for key, (_, _, raw) in weights.items()
+            }
             message = {
                 "type": "learning",
                 "learning_type": "model_update",
                 "weights": weights,
+                "hashes": hashes,
+                "num_samples": len(self.experience_buffer),
                 "source_agent": self.agent_id,
                 "knowledge_type": knowledge_type
             }
             await self.communicate(message, target_agent)
         
         elif knowledge_type == "experiences":
-            # Share recent experiences
-            recent_experiences = self.experience_buffer[-100:]  # Last 100 experiences
+            # Share recent experiences (last 100, walked from the newest end)
+            recent_experiences = list(islice(reversed(self.experience_buffer), 100))[::-1]
             message = {
                 "type": "learning",
                 "learning_type": "experience_sharing",
@@ -590,9 +1011,12 @@ class LearningAgent(BaseAgent):
             # Convert observation to tensor
             obs_tensor = self._observation_to_tensor(observation)
             
-            # Get action probabilities from model
-            with torch.no_grad():
-                action_probs = self.neural_model(obs_tensor)
+            # Get action probabilities from model (inference_mode also skips
+            # autograd version-counter bookkeeping, unlike no_grad)
+            async with self._model_lock:
+                self._wait_for_fedavg()
+                with torch.inference_mode():
+                    action_probs = self._forward_module()(obs_tensor)
             
             # Select action (epsilon-greedy)
             if np.random.random() < self.exploration_rate:
@@ -635,7 +1059,7 @@ class LearningAgent(BaseAgent):
     async def _initialize_neural_model(self) -> None:
         """Initialize the neural model architecture."""
         # Simple feedforward network as example
-        input_size = 128  # Observation feature size
+        input_size = OBSERVATION_FEATURE_SIZE
         hidden_size = 256
         output_size = 10  # Number of possible actions
         
@@ -647,12 +1071,54 @@ class LearningAgent(BaseAgent):
             nn.Linear(hidden_size, output_size),
             nn.Softmax(dim=-1)
         )
+        # Topology is fixed from here on (weight loads/updates keep shapes)
+        self._model_param_count = sum(p.numel() for p in self.neural_model.parameters())
         
         # Initialize optimizer
         self.optimizer = torch.optim.Adam(
             self.neural_model.parameters(),
             lr=self.learning_rate
         )
+        
+        if self.config.torch_compile:
+            self._compile_model()
+    
+    def _compile_model(self) -> None:
+        """Compile the model forward pass and the training step with torch.compile.
+        
+        Compilation is lazy, so both are warmed up on dummy inputs here; any
+        backend or Dynamo failure then falls back to eager mode instead of
+        surfacing on every later forward pass or training step.
+        """
+        try:
+            # The compiled wrapper is only called; state_dict keys come from the
+            # eager module, so weights stay interchangeable with other agents
+            self._compiled_model = torch.compile(self.neural_model)
+            self._loss_fn = torch.compile(_q_learning_loss)
+            
+            state = torch.zeros(2, OBSERVATION_FEATURE_SIZE)
+            with torch.inference_mode():
+                self._compiled_model(state[0])
+            loss = self._loss_fn(
+                self._compiled_model,
+                state,
+                torch.zeros(2, dtype=torch.int64),
+                torch.zeros(2),
+                state,
+                torch.ones(2),
+                self.discount_factor
+            )
+            loss.backward()
+        except Exception as e:
+            self.logger.warning(f"torch.compile unavailable, using eager mode: {e}")
+            self._compiled_model = None
+            self._loss_fn = _q_learning_loss
+        finally:
+            self.neural_model.zero_grad(set_to_none=True)
+    
+    def _forward_module(self) -> nn.Module:
+        """Return the module to call: the compiled wrapper when compilation succeeded."""
+        return self.neural_model if self._compiled_model is None else self._compiled_model
     
     async def _train_model(self) -> None:
         """Train the neural model on experience buffer."""
@@ -661,48 +1127,50 @@ class LearningAgent(BaseAgent):
         
         try:
             # Sample batch from experience buffer
-            batch = np.random.choice(
+            batch = random.sample(
                 self.experience_buffer,
-                size=min(self.batch_size, len(self.experience_buffer)),
-                replace=False
-            ).tolist()
+                min(self.batch_size, len(self.experience_buffer))
+            )
             
             # Prepare training data
-            states = []
-            actions = []
-            rewards = []
-            next_states = []
-            
-            for exp in batch:
-                if "state" in exp and "action" in exp and "reward" in exp:
-                    states.append(exp["state"])
-                    actions.append(exp["action"])
-                    rewards.append(exp["reward"])
-                    next_states.append(exp.get("next_state", exp["state"]))
-            
-            if not states:
+            batch = [exp for exp in batch if self._validate_experience(exp)]
+            if not batch:
                 return
             
-            # Convert to tensors
-            state_tensor = torch.FloatTensor(states)
-            action_tensor = torch.LongTensor(actions)
-            reward_tensor = torch.FloatTensor(rewards)
-            next_state_tensor = torch.FloatTensor(next_states)
-            
-            # Forward pass
-            current_q_values = self.neural_model(state_tensor)
-            next_q_values = self.neural_model(next_state_tensor)
+            # Fill preallocated arrays and hand them to torch without a copy
+            batch_len = len(batch)
+            feature_dim = len(batch[0]["state"])
+            states = np.empty((batch_len, feature_dim), dtype=np.float32)
+            next_states = np.empty((batch_len, feature_dim), dtype=np.float32)
+            actions = np.empty(batch_len, dtype=np.int64)
+            rewards = np.empty(batch_len, dtype=np.float32)
+            dones = np.empty(batch_len, dtype=np.float32)
+            for i, exp in enumerate(batch):
+                states[i] = exp["state"]
+                actions[i] = exp["action"]
+                rewards[i] = exp["reward"]
+                # Without a next_state there is nothing to bootstrap from, so the
+                # transition is treated as terminal unless "done" says otherwise
+                next_state = exp.get("next_state")
+                next_states[i] = exp["state"] if next_state is None else next_state
+                dones[i] = exp.get("done", next_state is None)
             
-            # Compute target Q-values
-            target_q_values = current_q_values.clone()
-            for i in range(len(batch)):
-                target_q_values[i][action_tensor[i]] = (
-                    reward_tensor[i] + 
-                    self.discount_factor * torch.max(next_q_values[i])
-                )
+            state_tensor = torch.from_numpy(states)
+            action_tensor = torch.from_numpy(actions)
+            reward_tensor = torch.from_numpy(rewards)
+            next_state_tensor = torch.from_numpy(next_states)
+            done_tensor = torch.from_numpy(dones)
             
-            # Compute loss
-            loss = nn.MSELoss()(current_q_values, target_q_values.detach())
+            self._wait_for_fedavg()
+            loss = self._loss_fn(
+                self._forward_module(),
+                state_tensor,
+                action_tensor,
+                reward_tensor,
+                next_state_tensor,
+                done_tensor,
+                self.discount_factor
+            )
             
             # Backward pass
             self.optimizer.zero_grad()
@@ -713,31 +1181,23 @@ class LearningAgent(BaseAgent):
             self.learning_metrics["loss"] = loss.item()
             self.learning_metrics["episodes"] += 1
             
-            # Clear old experiences
-            if len(self.experience_buffer) > self.config.memory_size:
-                self.experience_buffer = self.experience_buffer[-self.config.memory_size:]
-            
         except Exception as e:
             self.logger.error(f"Error training model: {e}")
     
     def _observation_to_tensor(self, observation: AgentObservation) -> torch.Tensor:
         """Convert observation to tensor for neural model."""
-        # Simple conversion - should be customized per agent type
-        features = []
-        
-        # Add basic features
-        features.extend([
+        # Simple conversion - should be customized per agent type.
+        # Only the leading slots are written; the zero padding never changes.
+        features = _encode_observation_features(
+            self._obs_features,
             observation.confidence,
             len(str(observation.data)),
-            hash(observation.observation_type) % 1000 / 1000.0,
+            _observation_type_feature(observation.observation_type),
             time.time() % 3600 / 3600.0  # Time of day
-        ])
-        
-        # Pad to fixed size
-        while len(features) < 128:
-            features.append(0.0)
+        )
         
-        return torch.FloatTensor(features[:128])
+        # Copy out of the scratch buffer so callers never share storage
+        return torch.from_numpy(features).clone()
     
     def _index_to_action(self, action_idx: int, observation: AgentObservation) -> AgentAction:
         """Convert action index to AgentAction."""
@@ -768,14 +1228,52 @@ class LearningAgent(BaseAgent):
             self.logger.warning(f"Could not load model weights: {e}")
     
     async def _save_model_weights(self) -> None:
-        """Save current model weights."""
+        """Save current model weights.
+        
+        The weights are copied to CPU in a worker thread while holding the
+        model lock, so a training step cannot tear the checkpoint and the
+        event loop is free while tensors are copied and written.
+        """
         try:
             if self.neural_model:
-                weights = self.neural_model.state_dict()
+                async with self._model_lock:
+                    weights = await asyncio.to_thread(self._snapshot_weights)
                 await self.memory_manager.save_model_weights(weights)
         except Exception as e:
             self.logger.error(f"Could not save model weights: {e}")
     
+    def _snapshot_weights(self) -> Dict[str, torch.Tensor]:
+        """Copy the model's state dict into CPU tensors owned by the caller."""
+        self._wait_for_fedavg()
+        state = self.neural_model.state_dict()
+        cuda_device = next((t.device for t in state.values() if t.is_cuda), None)
+        if cuda_device is None:
+            # Pinning buys nothing without a device-to-host transfer
+            return {key: tensor.clone() for key, tensor in state.items()}
+        
+        staging = self._weight_staging
+        if staging is None or staging.keys() != state.keys() or any(
+            staging[key].shape != tensor.shape or staging[key].dtype != tensor.dtype
+            for key, tensor in state.items()
+        ):
+            # Pinned staging lets device-to-host copies run asynchronously
+            staging = self._weight_staging = {
+                key: torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=tensor.is_cuda)
+                for key, tensor in state.items()
+            }
+        
+        # Queue every copy on the save stream and wait once at the end
+        if self._save_stream is None:
+            self._save_stream = torch.cuda.Stream(device=cuda_device)
+        stream = self._save_stream
+        stream.wait_stream(torch.cuda.current_stream(cuda_device))
+        with torch.cuda.stream(stream):
+            for key, tensor in state.items():
+                staging[key].copy_(tensor, non_blocking=tensor.is_cuda)
+        stream.synchronize()
+        # The staging buffers are overwritten by the next save; hand out copies
+        return {key: tensor.clone() for key, tensor in staging.items()}
+    
     # Implementation of abstract methods
     async def _start_agent_tasks(self) -> None:
         """Start learning-specific background tasks."""
@@ -784,10 +1282,13 @@ class LearningAgent(BaseAgent):
             asyncio.create_task(self._periodic_model_save())
         )
         
-        # Add exploration rate decay
-        self._tasks.append(
-            asyncio.create_task(self._exploration_decay_loop())
-        )
+        # Start the exploration decay clock
+        self._explore_start_val = self.exploration_rate
+        self._explore_start_t = time.monotonic()
+        
+        # Add batched ingestion of shared experiences
+        self._experience_drain_task = asyncio.create_task(self._experience_drain_loop())
+        self._tasks.append(self._experience_drain_task)
     
     async def _work_on_goals(self, goals: List[AgentGoal]) -> None:
         """Work on achieving goals using learned behavior."""
@@ -798,18 +1299,20 @@ class LearningAgent(BaseAgent):
             # Create observation from goal
             goal_observation = AgentObservation(
                 observation_type="goal",
-                data=goal.dict(),
+                data=self._goal_dict(goal),
                 source="goal_system"
             )
             
             # Process and execute actions
             actions = await self.process_observation(goal_observation)
             for action in actions:
-                await self._execute_action_async(action)
+                # Same buckets as observed actions, so per-type order and the
+                # concurrency cap hold for goal-driven work too
+                await self._dispatch_action(action)
                 
                 # Check if goal is completed
-                if await self._is_goal_completed(goal):
-                    goal.status = "completed"
+                if self._is_goal_completed(goal):
+                    self._set_goal_status(goal, "completed")
                     self.logger.info(f"Completed goal: {goal.description}")
                     break
     
@@ -817,78 +1320,220 @@ class LearningAgent(BaseAgent):
         """Get learning-specific metrics."""
         return {
             **self.learning_metrics,
+            "exploration_rate": self.exploration_rate,
             "experience_buffer_size": len(self.experience_buffer),
-            "model_parameters": sum(p.numel() for p in self.neural_model.parameters()) if self.neural_model else 0
+            "model_parameters": self._model_param_count
         }
     
     async def _handle_task_assignment(self, message: Dict[str, Any]) -> None:
         """Handle task assignment with learning context."""
         task_data = message.get("task_data", {})
-        goal = AgentGoal(
-            description=task_data.get("description", "Assigned task"),
-            target_metrics=task_data.get("target_metrics", {}),
-            priority=task_data.get("priority", 5)
-        )
+        goal = AgentGoal.from_dict({
+            "description": task_data.get("description", "Assigned task"),
+            "target_metrics": task_data.get("target_metrics", {}),
+            "priority": task_data.get("priority", 5)
+        })
         await self.add_goal(goal)
     
     async def _handle_resource_sharing(self, message: Dict[str, Any]) -> None:
         """Handle resource sharing with learning optimization."""
-        resource_type = message.get("resource_type")
-        if resource_type == "computation":
-            # Share computational resources
-            pass
-        elif resource_type == "data":
-            # Share training data
-            pass
+        handler = self._resource_handlers.get(message.get("resource_type"))
+        if handler:
+            await handler(message)
+    
+    async def _share_computation(self, message: Dict[str, Any]) -> None:
+        """Share computational resources."""
+        pass
+    
+    async def _share_data(self, message: Dict[str, Any]) -> None:
+        """Share training data."""
+        pass
     
     async def _handle_knowledge_sharing(self, message: Dict[str, Any]) -> None:
         """Handle knowledge sharing from other agents."""
-        knowledge_type = message.get("knowledge_type")
-        if knowledge_type == "experiences":
-            experiences = message.get("experiences", [])
-            self.experience_buffer.extend(experiences)
-        elif knowledge_type == "model_insights":
-            insights = message.get("insights", {})
-            await self.knowledge_base.add_insights(insights)
+        handler = self._knowledge_handlers.get(message.get("knowledge_type"))
+        if handler:
+            await handler(message)
+    
+    async def _ingest_experiences(self, message: Dict[str, Any]) -> None:
+        """Add experiences shared through coordination to the replay buffer."""
+        experiences = message.get("experiences", [])
+        self.experience_buffer.extend(experiences)
+    
+    async def _ingest_insights(self, message: Dict[str, Any]) -> None:
+        """Store model insights shared by another agent."""
+        insights = message.get("insights", {})
+        await self.knowledge_base.add_insights(insights)
     
     async def _handle_model_update(self, message: Dict[str, Any]) -> None:
-        """Handle neural model updates from other agents."""
-        weights = message.get("weights")
-        if weights and self.neural_model:
-            # Federated learning: average weights
-            current_weights = self.neural_model.state_dict()
-            for key in current_weights:
-                if key in weights:
-                    current_weights[key] = (current_weights[key] + weights[key]) / 2
-            self.neural_model.load_state_dict(current_weights)
+        """Handle neural model updates from other agents.
+        
+        Federated averaging weighted by each side's experience count, applied
+        in place to the model's tensors (no load_state_dict round trip).
+        """
+        encoded = message.get("weights")
+        if not encoded or not self.neural_model:
+            return
+        hashes = message.get("hashes") or {}
+        if not isinstance(encoded, dict) or not isinstance(hashes, dict):
+            self.logger.warning("Dropping malformed model update: weights and hashes must be dicts")
+            return
+        
+        n_remote = message.get("num_samples", 0)
+        if not isinstance(n_remote, int) or isinstance(n_remote, bool) or n_remote < 0:
+            self.logger.warning(f"Dropping model update with invalid num_samples: {n_remote!r}")
+            return
+        n_local = len(self.experience_buffer)
+        total = n_local + n_remote
+        remote_share = n_remote / total if total > 0 else 0.5
+        if remote_share == 0:
+            return
+        
+        # Tensors the sender has not changed since its last update were
+        # already averaged in; skip decoding and blending them again
+        peer = message.get("source_agent")
+        if not isinstance(peer, str):
+            peer = None
+        seen = self._peer_weight_hashes.get(peer, {})
+        changed = {
+            name: blob for name, blob in encoded.items()
+            if name not in hashes or hashes[name] != seen.get(name)
+        }
+        if not changed:
+            return
+        
+        try:
+            weights = {
+                name: _decode_tensor(*blob) for name, blob in changed.items()
+            }
+        except (TypeError, ValueError) as e:
+            self.logger.warning(f"Dropping malformed model update: {e}")
+            return
+        
+        # The tensor math runs in a worker thread so the event loop keeps
+        # dispatching messages; the lock keeps training/inference off the
+        # model until the update has landed (on CUDA, until it is queued on
+        # the side stream, which later model users wait on)
+        try:
+            async with self._model_lock:
+                blended = await asyncio.to_thread(self._fedavg_inplace, weights, remote_share)
+        except ValueError as e:
+            self.logger.warning(f"Dropping incompatible model update: {e}")
+            return
+        # Only tensors that were actually averaged in count as seen
+        if peer is not None and hashes:
+            seen = self._peer_weight_hashes.setdefault(peer, {})
+            seen.update((name, hashes[name]) for name in blended if name in hashes)
+    
+    def _fedavg_inplace(self, weights: Dict[str, torch.Tensor], remote_share: float) -> List[str]:
+        """Blend remote weights into the model in place (runs off the event loop).
+        
+        Returns the names of the tensors that were blended. Raises ValueError,
+        leaving the model untouched, if any remote tensor does not fit.
+        """
+        # Walk the live tensors directly rather than building a state_dict()
+        named_tensors = chain(
+            self.neural_model.named_parameters(),
+            self.neural_model.named_buffers()
+        )
+        names, local, remote = _match_fedavg_tensors(named_tensors, weights)
+        if not local:
+            return names
+        
+        devices = {tensor.device for tensor in local}
+        if len(devices) > 1:
+            raise ValueError(f"model tensors span several devices: {sorted(map(str, devices))}")
+        device = devices.pop()
+        if device.type != "cuda":
+            _blend_inplace(local, remote, remote_share)
+            return names
+        
+        if self._fedavg_stream is None:
+            self._fedavg_stream = torch.cuda.Stream(device=device)
+        stream = self._fedavg_stream
+        # Start only after kernels already queued against these weights
+        stream.wait_stream(torch.cuda.current_stream(device))
+        with torch.cuda.stream(stream):
+            remote = [r.to(device, non_blocking=True) for r in remote]
+            _blend_inplace(local, remote, remote_share)
+            self._fedavg_done = stream.record_event()
+        return names
+    
+    def _wait_for_fedavg(self) -> None:
+        """Order the current CUDA stream after any queued federated update."""
+        done = self._fedavg_done
+        if done is not None:
+            self._fedavg_done = None
+            torch.cuda.current_stream(done.device).wait_event(done)
     
     async def _handle_experience_sharing(self, message: Dict[str, Any]) -> None:
-        """Handle shared experiences from other agents."""
-        experiences = message.get("experiences", [])
-        # Filter and validate experiences before adding
-        valid_experiences = [exp for exp in experiences if self._validate_experience(exp)]
-        self.experience_buffer.extend(valid_experiences)
+        """Handle shared experiences from other agents.
+        
+        Once the agent is running, messages are queued and ingested in bursts
+        by _experience_drain_loop; before that they are ingested directly.
+        """
+        if self._experience_drain_task is None or self._experience_drain_task.done():
+            self._ingest_shared_experiences([message])
+        else:
+            self._shared_experience_queue.put_nowait(message)
+    
+    async def _experience_drain_loop(self) -> None:
+        """Ingest every queued experience-sharing message in one pass per wakeup."""
+        queue = self._shared_experience_queue
+        while True:
+            messages = [await queue.get()]
+            while not queue.empty():
+                messages.append(queue.get_nowait())
+            # Bad peer input must not kill the task; later messages still arrive
+            try:
+                self._ingest_shared_experiences(messages)
+            except Exception as e:
+                self.logger.error(f"Error ingesting shared experiences: {e}")
+    
+    def _ingest_shared_experiences(self, messages: List[Dict[str, Any]]) -> None:
+        """Validate and buffer the experiences carried by a batch of messages."""
+        # Filter and validate experiences before adding; peers may send
+        # anything, so non-dict entries are skipped rather than raising
+        required = self._REQUIRED_EXPERIENCE_FIELDS
+        for message in messages:
+            experiences = message.get("experiences") if isinstance(message, dict) else None
+            if not isinstance(experiences, list):
+                continue
+            self.experience_buffer.extend(
+                exp for exp in experiences
+                if isinstance(exp, dict) and required <= exp.keys()
+            )
     
     def _validate_experience(self, experience: Dict[str, Any]) -> bool:
         """Validate that an experience is suitable for learning."""
-        required_fields = ["action", "state", "reward"]
-        return all(field in experience for field in required_fields)
+        return isinstance(experience, dict) and self._REQUIRED_EXPERIENCE_FIELDS <= experience.keys()
+    
+    async def _periodic_ticks(self, interval: float, jitter: float = 0.1) -> AsyncIterator[None]:
+        """Yield every ``interval`` seconds for as long as the agent runs.
+        
+        Deadlines are absolute, so time spent in the loop body does not
+        accumulate as drift. The first deadline is offset by up to ``jitter``
+        of the interval so agents sharing a process do not all fire together.
+        """
+        loop = asyncio.get_running_loop()
+        next_t = loop.time() + interval * (1.0 + random.uniform(-jitter, jitter))
+        while self._running:
+            await asyncio.sleep(max(0.0, next_t - loop.time()))
+            next_t += interval
+            yield
     
     async def _periodic_model_save(self) -> None:
         """Periodically save model weights."""
-        while self._running:
-            await asyncio.sleep(300)  # Save every 5 minutes
+        async for _ in self._periodic_ticks(300):  # Save every 5 minutes
             await self._save_model_weights()
     
-    async def _exploration_decay_loop(self) -> None:
-        """Gradually decay exploration rate."""
-        while self._running:
-            await asyncio.sleep(60)  # Check every minute
-            if self.exploration_rate > 0.01:
-                self.exploration_rate *= 0.999
-                self.learning_metrics["exploration_rate"] = self.exploration_rate
-    
-    async def _is_goal_completed(self, goal: AgentGoal) -> bool:
+    def _is_goal_completed(self, goal: AgentGoal) -> bool:
         """Check if a goal has been completed."""
-        # Simple heuristic - should be customized per goal type
-        return time.time() - goal.timestamp > 60  # Consider completed after 1 minute
\ No newline at end of file
+        # Simple heuristic - should be customized per goal type.
+        # Goals restored from saved state were not added here; start their clock now.
+        due = self._goal_completion_due.get(goal.goal_id)
+        if due is None:
+            due = self._goal_completion_due[goal.goal_id] = (
+                time.monotonic() + self._GOAL_COMPLETION_SECONDS
+            )
+        return time.monotonic() >= due
\ No newline at end of file
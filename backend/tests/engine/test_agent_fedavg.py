@@ -0,0 +1,76 @@
+"""Regression tests for federated averaging in LearningAgent."""
+
+import importlib
+import sys
+import types
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+# Modules agent.py imports that live outside this package's core
+_STUBBED_MODULES = {
+    "backend.engine.core.memory": ("MemoryManager", "KnowledgeBase"),
+    "backend.engine.core.communication": ("AgentCommunicator",),
+    "backend.engine.monitoring": (),
+    "backend.engine.monitoring.metrics": ("MetricsCollector",),
+}
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """Import backend.engine.core.agent with its service dependencies stubbed out."""
+    for module_name, class_names in _STUBBED_MODULES.items():
+        module = types.ModuleType(module_name)
+        for class_name in class_names:
+            setattr(module, class_name, type(class_name, (), {}))
+        monkeypatch.setitem(sys.modules, module_name, module)
+    monkeypatch.delitem(sys.modules, "backend.engine.core.agent", raising=False)
+    return importlib.import_module("backend.engine.core.agent")
+
+
+def _fedavg(agent, model, weights, remote_share):
+    # _fedavg_inplace only touches these attributes, so skip building a full agent
+    fake_agent = types.SimpleNamespace(
+        neural_model=model, _fedavg_stream=None, _fedavg_done=None
+    )
+    return agent.LearningAgent._fedavg_inplace(fake_agent, weights, remote_share)
+
+
+def _model():
+    torch.manual_seed(0)
+    return torch.nn.Sequential(torch.nn.Linear(4, 3), torch.nn.ReLU(), torch.nn.Linear(3, 2))
+
+
+def test_fedavg_blends_bfloat16_update(agent):
+    model = _model()
+    before = {k: v.clone() for k, v in model.state_dict().items()}
+    remote = {k: torch.ones_like(v, dtype=torch.bfloat16) for k, v in before.items()}
+
+    names = _fedavg(agent, model, remote, 0.25)
+
+    assert sorted(names) == sorted(before)
+    for key, tensor in model.state_dict().items():
+        torch.testing.assert_close(tensor, 0.75 * before[key] + 0.25)
+
+
+def test_fedavg_shape_mismatch_leaves_model_untouched(agent):
+    model = _model()
+    before = {k: v.clone() for k, v in model.state_dict().items()}
+    remote = {k: v.to(torch.bfloat16) for k, v in before.items()}
+    remote["0.weight"] = remote["0.weight"].t().contiguous()
+
+    with pytest.raises(ValueError, match="0.weight"):
+        _fedavg(agent, model, remote, 1.0)
+
+    for key, tensor in model.state_dict().items():
+        assert torch.equal(tensor, before[key])
+
+
+def test_decode_rejects_shape_byte_mismatch(agent):
+    shape, dtype, raw = agent._encode_tensor(torch.zeros(2, 3))
+
+    with pytest.raises(ValueError):
+        agent._decode_tensor([3, 3], dtype, raw)
+
+    assert torch.equal(agent._decode_tensor(shape, dtype, raw), torch.zeros(2, 3))